@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import datetime
 from collections import defaultdict
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, Iterator, NamedTuple
 
 import discord
 from redbot.core import commands
@@ -11,8 +10,8 @@ from redbot.core.utils.chat_formatting import humanize_list, humanize_timedelta,
 from ..commands.command import DynamicHelp
 from ..commands.converters import ServiceConverter
 from ..core.abc import MixinMeta
-from ..objects import SendCache, Update
-from ..updateloop import SendUpdate, process_json
+from ..objects import IncidentData, SendCache, Update
+from ..updateloop import SendUpdate, process_json_both
 
 
 class Comps(NamedTuple):
@@ -43,6 +42,20 @@ def process_components(json_data: dict) -> Comps:
     return Comps(groups, degraded_comps)
 
 
+class ToSend(NamedTuple):
+    to_send: IncidentData | None
+    other_incidents: list[IncidentData]
+    other_scheduled: list[IncidentData]
+
+
+def pick_to_send(incidents: list[IncidentData], scheduled: Iterator[IncidentData]) -> ToSend:
+    # only want to send 1 thing, so scheduled is only processed if there's no incidents
+    if incidents:
+        return ToSend(incidents[0], incidents[1:], [])
+    to_send = next(scheduled, None)
+    return ToSend(to_send, [], list(scheduled) if to_send else [])
+
+
 class StatusCom(MixinMeta):
     # TODO: support DMs
     @commands.guild_only()  # type:ignore
@@ -65,16 +78,24 @@ class StatusCom(MixinMeta):
             )
             return await ctx.send(message, delete_after=time_until)
 
-        if restrictions := self.service_restrictions_cache.get_guild(ctx.guild.id, service.name):
-            channels = [self.bot.get_channel(channel) for channel in restrictions]
-            channel_list = humanize_list(
-                [
-                    channel.mention
-                    for channel in channels
-                    if isinstance(channel, (discord.TextChannel, discord.Thread))
-                ],
-                style="or",
+        if self.service_restrictions_cache.has_restrictions(ctx.guild.id) and (
+            restrictions := self.service_restrictions_cache.get_guild(ctx.guild.id, service.name)
+        ):
+            channel_list = self.service_restrictions_cache.get_channel_list(
+                ctx.guild.id, service.name
             )
+            if channel_list is None:
+                channel_list = humanize_list(
+                    [
+                        channel.mention
+                        for channel in map(self.bot.get_channel, restrictions)
+                        if isinstance(channel, (discord.TextChannel, discord.Thread))
+                    ],
+                    style="or",
+                )
+                self.service_restrictions_cache.set_channel_list(
+                    ctx.guild.id, service.name, channel_list
+                )
             if channel_list:
                 return await ctx.send(
                     f"You can check updates for {service.friendly} in {channel_list}."
@@ -87,23 +108,13 @@ class StatusCom(MixinMeta):
         if status != 200:
             return await ctx.send(f"Hmm, I can't get {service.friendly}'s status at the moment.")
 
-        incidents_incidentdata_list = process_json(summary, "incidents")
-        all_scheduled = process_json(summary, "scheduled")
+        # scheduled is lazy and only includes ones happening
+        incidents_incidentdata_list, scheduled_incidentdata_iter = process_json_both(summary)
         components = process_components(summary)
-        now = datetime.datetime.now(datetime.timezone.utc)
-        scheduled_incidentdata_list = [
-            i for i in all_scheduled if i.scheduled_for and i.scheduled_for < now
-        ]  # only want ones happening
-
-        other_incidents, other_scheduled = [], []
-        if incidents_incidentdata_list:
-            to_send = incidents_incidentdata_list[0]
-            other_incidents = incidents_incidentdata_list[1:]
-        elif scheduled_incidentdata_list:  # only want to send 1 thing
-            to_send = scheduled_incidentdata_list[0]
-            other_scheduled = scheduled_incidentdata_list[1:]
-        else:
-            to_send = None
+
+        to_send, other_incidents, other_scheduled = pick_to_send(
+            incidents_incidentdata_list, scheduled_incidentdata_iter
+        )
 
         if not to_send:
             msg = (
@@ -120,9 +131,7 @@ class StatusCom(MixinMeta):
                 colour=await ctx.embed_colour(),
             )
             for group, comps in components.degraded_comps.items():
-                value = ""
-                for comp in comps:
-                    value += comp + "\n"
+                value = "\n".join(comps)
                 for page in pagify(value, page_length=1024):
                     embed.add_field(name=group, value=page, inline=False)
 
@@ -133,8 +142,6 @@ class StatusCom(MixinMeta):
             await ctx.send(msg)
 
         if to_send:
-            msg = ""
-
             update = Update(to_send, to_send.fields)
             await SendUpdate(
                 self.bot,
@@ -148,20 +155,19 @@ class StatusCom(MixinMeta):
                 {ctx.channel.id: {"mode": "all", "webhook": False, "edit_id": {}}},
             )
 
+            msg_parts = []
             if other_incidents:
-                msg += f"{len(other_incidents)} other incidents are live at the moment:\n"
-                for incident in other_incidents:
-                    msg += f"{incident.title} (<{incident.link}>)\n"
-                msg += "\n"
+                links = "\n".join(f"{i.title} (<{i.link}>)" for i in other_incidents)
+                msg_parts.append(
+                    f"{len(other_incidents)} other incidents are live at the moment:\n{links}"
+                )
 
             if other_scheduled:
-                msg += (
+                links = "\n".join(f"{i.title} (<{i.link}>)" for i in other_scheduled)
+                msg_parts.append(
                     f"{len(other_scheduled)} other scheduled maintenance events are live at the "
-                    "moment:\n"
+                    f"moment:\n{links}"
                 )
-                for incident in other_scheduled:
-                    msg += f"{incident.title} (<{incident.link}>)\n"
-                msg += "\n"
 
-            if msg:
-                await ctx.send(msg)
+            if msg_parts:
+                await ctx.send("\n\n".join(msg_parts))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
-from time import time
+from time import monotonic, time
 from typing import Literal
 
 from ..core import FEEDS, SERVICE_LITERAL
@@ -45,9 +45,17 @@ class ServiceRestrictionsCache:
             __data[g_id] = data["service_restrictions"]
 
         self.__data = __data
+        # so guilds without any restrictions (most of them) can be skipped quickly
+        self.__guilds_with_restrictions = {
+            g_id for g_id, services in __data.items() if any(services.values())
+        }
+
+        # humanized channel mentions for the status command, (guild_id, service): (time, str)
+        self.__channel_list_data: dict[tuple[int, str], tuple[float, str]] = {}
 
     def add_restriction(self, guild_id: int, service: str, channel_id: int) -> None:
         """Add a channel to the restriction cache."""
+        self.__channel_list_data.pop((guild_id, service), None)
         try:
             self.__data[guild_id]
         except KeyError:
@@ -58,13 +66,23 @@ class ServiceRestrictionsCache:
         except KeyError:
             self.__data[guild_id][service] = [channel_id]
 
+        self.__guilds_with_restrictions.add(guild_id)
+
     def remove_restriction(self, guild_id: int, service: str, channel_id: int) -> None:
         """Remove a channel from the restriction cache."""
+        self.__channel_list_data.pop((guild_id, service), None)
         try:
             self.__data.get(guild_id, {}).get(service, []).remove(channel_id)
         except ValueError:  # not in list
             pass
 
+        if not any(self.__data.get(guild_id, {}).values()):
+            self.__guilds_with_restrictions.discard(guild_id)
+
+    def has_restrictions(self, guild_id: int) -> bool:
+        """Check if a guild has any restrictions for any service."""
+        return guild_id in self.__guilds_with_restrictions
+
     def get_guild(self, guild_id: int, service: str | None = None) -> dict | list:
         """Get the channels, optionally for a specific service, in a guild."""
         if service:
@@ -72,6 +90,17 @@ class ServiceRestrictionsCache:
         else:
             return self.__data.get(guild_id, {})
 
+    def get_channel_list(self, guild_id: int, service: str) -> str | None:
+        """Get the cached channel list for the status command, if it's under 60 seconds old."""
+        cached = self.__channel_list_data.get((guild_id, service))
+        if cached is None or monotonic() - cached[0] > 60:
+            return None
+        return cached[1]
+
+    def set_channel_list(self, guild_id: int, service: str, channel_list: str) -> None:
+        """Cache the channel list for the status command."""
+        self.__channel_list_data[(guild_id, service)] = (monotonic(), channel_list)
+
 
 class LastChecked:
     """Store when incidents were last checked."""
@@ -1,3 +1,3 @@
-from .processfeed import process_json
+from .processfeed import process_json, process_json_both
 from .sendupdate import SendUpdate
 from .updatechecker import StatusLoop
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import datetime
 import re
 import warnings
+from typing import Iterator
 
 from bs4 import MarkupResemblesLocatorWarning
 from dateutil.parser import parse as parse_time
@@ -156,3 +158,31 @@ def process_json(json_resp: dict, type: TYPES_LITERAL) -> list[IncidentData]:
             _process(j_data, "scheduled") for j_data in json_resp.get("scheduled_maintenances", [])
         ]
     return []
+
+
+def process_json_both(
+    json_resp: dict,
+) -> tuple[list[IncidentData], Iterator[IncidentData]]:
+    """Turn the API into life, getting incidents and live scheduled maintenance at once.
+
+    Scheduled maintenance is processed lazily, and ones which haven't started yet are
+    skipped before any processing.
+
+    Parameters
+    ----------
+    json_resp : dict
+        Response from Status API
+
+    Returns
+    -------
+    Tuple[List[IncidentData], Iterator[IncidentData]]
+        Parsed incidents and parsed scheduled maintenance that is happening now
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    incidents = [_process(j_data, "incidents") for j_data in json_resp.get("incidents", [])]
+    scheduled = (
+        _process(j_data, "scheduled")
+        for j_data in json_resp.get("scheduled_maintenances", [])
+        if j_data.get("scheduled_for") and parse_time(j_data["scheduled_for"]) < now
+    )
+    return incidents, scheduled
@@ -1,4 +1,9 @@
-from status.objects import SendCache, UpdateField
+import inspect
+from copy import deepcopy
+from typing import Iterator
+
+from status.commands.status_com import pick_to_send
+from status.objects import SendCache, ServiceRestrictionsCache, UpdateField, caches
 from status.objects.incidentdata import Update
 from status.updateloop import processfeed
 
@@ -63,3 +68,121 @@ def test_example_incident():
     assert sc_sch.embed_all.to_dict() == STATUS_EXPECTED_EMBED_SCHEDULED_ALL
     assert sc_inc.plain_all == STATUS_EXPECTED_PLAIN_INCIDENTS_ALL
     assert sc_sch.plain_all == STATUS_EXPECTED_PLAIN_SCHEDULED_ALL
+
+
+def test_process_json_both():
+    not_started = deepcopy(TEST_FEED_DATA_SCHEDULED["scheduled_maintenances"][0])
+    not_started["id"] = "not_started"
+    not_started["scheduled_for"] = "2999-01-01T00:00:00.000-06:00"
+    no_time = deepcopy(TEST_FEED_DATA_SCHEDULED["scheduled_maintenances"][0])
+    no_time["id"] = "no_time"
+    no_time["scheduled_for"] = None
+    missing_time = deepcopy(TEST_FEED_DATA_SCHEDULED["scheduled_maintenances"][0])
+    missing_time["id"] = "missing_time"
+    del missing_time["scheduled_for"]
+
+    incidents, scheduled = processfeed.process_json_both(
+        {
+            **TEST_FEED_DATA_INCIDENTS,
+            "scheduled_maintenances": [
+                not_started,
+                *TEST_FEED_DATA_SCHEDULED["scheduled_maintenances"],
+                no_time,
+                missing_time,
+            ],
+        }
+    )
+
+    # scheduled is left for the caller to consume
+    assert isinstance(scheduled, Iterator)
+    assert inspect.getgeneratorstate(scheduled) == inspect.GEN_CREATED
+
+    assert [i.incident_id for i in incidents] == [
+        i.incident_id for i in processfeed.process_json(TEST_FEED_DATA_INCIDENTS, "incidents")
+    ]
+    # both in the test data have started, the others haven't or have no time
+    assert [i.incident_id for i in scheduled] == [
+        i.incident_id for i in processfeed.process_json(TEST_FEED_DATA_SCHEDULED, "scheduled")
+    ]
+
+
+def test_pick_to_send():
+    incidents = processfeed.process_json(TEST_FEED_DATA_INCIDENTS, "incidents")
+    all_scheduled = processfeed.process_json(TEST_FEED_DATA_SCHEDULED, "scheduled")
+
+    # live incident, scheduled isn't touched
+    _, scheduled = processfeed.process_json_both(TEST_FEED_DATA_SCHEDULED)
+    to_send, other_incidents, other_scheduled = pick_to_send(incidents, scheduled)
+    assert to_send is incidents[0]
+    assert other_incidents == incidents[1:]
+    assert other_scheduled == []
+    assert inspect.getgeneratorstate(scheduled) == inspect.GEN_CREATED
+
+    # no incidents, first live maintenance is sent and the rest listed
+    _, scheduled = processfeed.process_json_both(TEST_FEED_DATA_SCHEDULED)
+    to_send, other_incidents, other_scheduled = pick_to_send([], scheduled)
+    assert to_send is not None
+    assert to_send.incident_id == all_scheduled[0].incident_id
+    assert other_incidents == []
+    assert [i.incident_id for i in other_scheduled] == [i.incident_id for i in all_scheduled[1:]]
+
+    # nothing at all
+    assert pick_to_send([], iter([])) == (None, [], [])
+
+
+def test_restrictions_channel_list_cache(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(caches, "monotonic", lambda: now)
+    cache = ServiceRestrictionsCache({1: {"service_restrictions": {"discord": [10]}}})
+
+    assert cache.get_channel_list(1, "discord") is None
+    cache.set_channel_list(1, "discord", "#a")
+    assert cache.get_channel_list(1, "discord") == "#a"
+
+    now += 61
+    assert cache.get_channel_list(1, "discord") is None
+
+    cache.set_channel_list(1, "discord", "#a")
+    cache.set_channel_list(1, "github", "#b")
+    cache.add_restriction(1, "discord", 11)
+    assert cache.get_channel_list(1, "discord") is None
+    assert cache.get_channel_list(1, "github") == "#b"
+
+    cache.set_channel_list(1, "discord", "#a or #c")
+    cache.remove_restriction(1, "discord", 11)
+    assert cache.get_channel_list(1, "discord") is None
+
+
+def test_restrictions_guilds_with_restrictions():
+    cache = ServiceRestrictionsCache(
+        {
+            1: {"service_restrictions": {"discord": [10], "github": []}},
+            2: {"service_restrictions": {"discord": [], "github": []}},
+            3: {"service_restrictions": {}},
+        }
+    )
+    assert cache.has_restrictions(1)
+    assert not cache.has_restrictions(2)
+    assert not cache.has_restrictions(3)
+    assert not cache.has_restrictions(4)
+
+    # new guild, and one already in config without any
+    cache.add_restriction(4, "discord", 40)
+    cache.add_restriction(2, "github", 20)
+    assert cache.has_restrictions(4)
+    assert cache.has_restrictions(2)
+
+    # still has one for another service
+    cache.add_restriction(1, "github", 11)
+    cache.remove_restriction(1, "discord", 10)
+    assert cache.has_restrictions(1)
+
+    # last channels removed
+    cache.remove_restriction(1, "github", 11)
+    cache.remove_restriction(4, "discord", 40)
+    assert not cache.has_restrictions(1)
+    assert not cache.has_restrictions(4)
+
+    # removing something that isn't there doesn't change anything
+    cache.remove_restriction(2, "discord", 999)
+    assert cache.has_restrictions(2)